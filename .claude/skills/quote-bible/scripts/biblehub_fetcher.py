@@ -11,17 +11,35 @@ from pathlib import Path
 from typing import Dict, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Handle both relative imports (when used as module) and direct imports (when run as script)
 try:
-    from .biblehub_urls import BIBLEHUB_MULTI_URL_TEMPLATE, REQUEST_TIMEOUT
+    from .biblehub_urls import (
+        BIBLEHUB_MULTI_URL_TEMPLATE,
+        MAX_RETRIES,
+        REQUEST_TIMEOUT,
+        RETRY_AFTER_MAX,
+        RETRY_BACKOFF_FACTOR,
+        RETRY_STATUS_CODES,
+        USER_AGENT,
+    )
     from .book_codes import get_biblehub_book_name
     from .version_codes import ALL_VERSION_MAPPINGS, LANGUAGE_PATTERNS
 except ImportError:
     # Running as a script, use direct imports
     script_dir = Path(__file__).parent
     sys.path.insert(0, str(script_dir))
-    from biblehub_urls import BIBLEHUB_MULTI_URL_TEMPLATE, REQUEST_TIMEOUT
+    from biblehub_urls import (
+        BIBLEHUB_MULTI_URL_TEMPLATE,
+        MAX_RETRIES,
+        REQUEST_TIMEOUT,
+        RETRY_AFTER_MAX,
+        RETRY_BACKOFF_FACTOR,
+        RETRY_STATUS_CODES,
+        USER_AGENT,
+    )
     from book_codes import get_biblehub_book_name
     from version_codes import ALL_VERSION_MAPPINGS, LANGUAGE_PATTERNS
 
@@ -43,9 +61,46 @@ except ImportError:
         VERSION_NAME_PREFIXES = {}
 
 CACHE_ROOT = Path('bible/commentary')
+
+# Shared HTTP session (pooled keep-alive connections) for all BibleHub requests
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+
+
+class CappedRetry(Retry):
+    """Retry policy that honours Retry-After, but waits at most RETRY_AFTER_MAX seconds."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+# Retry connection failures and transient statuses; once exhausted, the last
+# response is returned so raise_for_status() reports the real status code.
+# Read timeouts are not retried, so they still surface as requests.Timeout.
+SESSION.mount('https://', HTTPAdapter(max_retries=CappedRetry(
+    total=MAX_RETRIES,
+    read=False,
+    backoff_factor=RETRY_BACKOFF_FACTOR,
+    status_forcelist=RETRY_STATUS_CODES,
+    raise_on_status=False,
+)))
 # IMPORTANT: you must keep the .cache suffix as this is copyrighted works and .gitignore will skip adding it to source
 SUFFIX = "translations-biblehub.cache"
 
+# Parsing patterns
+# Version entry: <span class="versiontext"><a href="...">VERSION_NAME</a> followed by the verse text
+VERSION_ENTRY_PATTERN = re.compile(
+    r'<span class="versiontext"><a[^>]*href="[^"]*?/([a-z0-9]+)/[^"]*"[^>]*>([^<]+)</a>(?:</span>)?(?:<br\s*/?>)?\s*(.*?)(?=<span class="versiontext">|<p><span class="versiontext">|<div |$)',
+    re.DOTALL | re.IGNORECASE
+)
+LANGUAGE_SPAN_PATTERN = re.compile(r'<span class="[a-z]{2,5}">([^<]+)</span>')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+VERSE_REF_PREFIX_PATTERN = re.compile(r'^[\w\s]+\d+:\d+\s+')
+NON_ALPHANUMERIC_PATTERN = re.compile(r'[^a-z0-9]')
+
 class VerseFetchError(Exception):
     """Exception raised when verse fetching fails."""
     pass
@@ -124,7 +179,7 @@ def fetch_verse_from_web(book: str, chapter: int, verse: int) -> Dict[str, str]:
 
     try:
         # Make HTTP GET request
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
 
         # Force UTF-8 encoding (BibleHub serves UTF-8 but requests may detect wrong encoding)
@@ -204,10 +259,51 @@ def normalize_version_name(version_name: str) -> str:
         'New International Version'
     """
     # Remove verse reference prefix (e.g., "Genesis 1:1 ")
-    version_name = re.sub(r'^[\w\s]+\d+:\d+\s+', '', version_name)
+    version_name = VERSE_REF_PREFIX_PATTERN.sub('', version_name)
     return version_name.strip()
 
 
+# English versions whose BibleHub URL abbreviation maps directly to eng-{ABBREV}
+ENGLISH_URL_ABBREVS = (
+    'niv', 'bsb', 'esv', 'nasb', 'kjv', 'nkjv', 'nlt',
+    'asv', 'akjv', 'web', 'ylt', 'dbt', 'drb', 'erv', 'wbt',
+    'hcsb', 'isv', 'net', 'gwt', 'jub', 'kj2000',
+)
+
+# Non-English BibleHub URL abbreviations -> ISO-639-3 language code
+URL_ABBREV_LANGUAGES = {
+    # Major languages
+    'ara': 'ara',  # Arabic
+    'chi': 'zho',  # Chinese
+    'fre': 'fra',  # French
+    'ger': 'deu',  # German
+    'gre': 'grc',  # Greek
+    'heb': 'heb',  # Hebrew
+    'ita': 'ita',  # Italian
+    'lat': 'lat',  # Latin
+    'por': 'por',  # Portuguese
+    'rus': 'rus',  # Russian
+    'spa': 'spa',  # Spanish
+
+    # Other languages (NT mostly)
+    'shu': 'jiv',  # Shuar
+    'ukr': 'ukr',  # Ukrainian
+    'kby': 'kab',  # Kabyle
+    'lav': 'lav',  # Latvian
+    'arm': 'hye',  # Armenian
+    'bas': 'eus',  # Basque
+    'taw': 'ttq',  # Tawallammat Tamajaq
+    'uma': 'ppk',  # Uma
+    'swa': 'swa',  # Swahili
+}
+
+# Flat URL abbreviation -> standardized code lookup
+URL_ABBREV_CODES = {
+    **{abbrev: f'eng-{abbrev.upper()}' for abbrev in ENGLISH_URL_ABBREVS},
+    **{abbrev: f'{lang}-{abbrev.upper()}' for abbrev, lang in URL_ABBREV_LANGUAGES.items()},
+}
+
+
 def map_url_abbrev_to_code(url_abbrev: str) -> str:
     """
     Map BibleHub URL abbreviation to standardized language code.
@@ -219,48 +315,10 @@ def map_url_abbrev_to_code(url_abbrev: str) -> str:
         url_abbrev: The abbreviation from BibleHub URL (e.g., "niv", "kjv", "shu")
         
     Returns:
-        Standardized version code (e.g., "eng-NIV", "jiv-NT")
+        Standardized version code (e.g., "eng-NIV", "jiv-SHU"), or "url-{abbrev}" if unknown
     """
-    # Map common English versions
-    if url_abbrev in ('niv', 'bsb', 'esv', 'nasb', 'kjv', 'nkjv', 'nlt'):
-        return f'eng-{url_abbrev.upper()}'
-    if url_abbrev in ('asv', 'akjv', 'web', 'ylt', 'dbt', 'drb', 'erv', 'wbt'):
-        return f'eng-{url_abbrev.upper()}'
-    if url_abbrev in ('hcsb', 'isv', 'net', 'gwt', 'jub', 'kj2000'):
-        return f'eng-{url_abbrev.upper()}'
-    
-    # Map non-English versions by URL code
-    url_to_lang = {
-        # Major languages
-        'ara': 'ara',  # Arabic
-        'chi': 'zho',  # Chinese
-        'fre': 'fra',  # French
-        'ger': 'deu',  # German
-        'gre': 'grc',  # Greek
-        'heb': 'heb',  # Hebrew
-        'ita': 'ita',  # Italian
-        'lat': 'lat',  # Latin
-        'por': 'por',  # Portuguese
-        'rus': 'rus',  # Russian
-        'spa': 'spa',  # Spanish
-        
-        # Other languages (NT mostly)
-        'shu': 'jiv',  # Shuar
-        'ukr': 'ukr',  # Ukrainian
-        'kby': 'kab',  # Kabyle
-        'lav': 'lav',  # Latvian
-        'arm': 'hye',  # Armenian
-        'bas': 'eus',  # Basque
-        'taw': 'ttq',  # Tawallammat Tamajaq
-        'uma': 'ppk',  # Uma
-        'swa': 'swa',  # Swahili
-    }
-    
-    if url_abbrev in url_to_lang:
-        return f'{url_to_lang[url_abbrev]}-{url_abbrev.upper()}'
-    
-    # If unknown, return as-is with unk prefix
-    return f'url-{url_abbrev}'
+    # Unknown abbreviations get a url- prefix
+    return URL_ABBREV_CODES.get(url_abbrev) or f'url-{url_abbrev}'
 
 
 def map_version_to_code_with_url(url_abbrev: str, version_name: str, debug: bool = False) -> str:
@@ -323,7 +381,7 @@ def map_version_to_code(version_name: str, debug: bool = False) -> str:
 
     # Fallback: create generic code
     # Remove non-alphanumeric, convert to lowercase, take first 10 chars
-    clean_name = re.sub(r'[^a-z0-9]', '', normalized.lower())[:10]
+    clean_name = NON_ALPHANUMERIC_PATTERN.sub('', normalized.lower())[:10]
     if debug:
         print(f"  DEBUG: Creating unk code for: '{normalized}' -> 'unk-{clean_name}'")
     return f'unk-{clean_name}'
@@ -355,12 +413,10 @@ def parse_biblehub_html(html_content: Union[str, bytes]) -> Dict[str, str]:
 
     translations = {}
 
-    # Pattern: Find version entries with <span class="versiontext"><a href="...">VERSION_NAME</a>
+    # Find version entries (see VERSION_ENTRY_PATTERN)
     # Extract both the href (which contains version abbreviation) and version name
     # The verse text follows after <br> or directly
-    version_pattern = r'<span class="versiontext"><a[^>]*href="[^"]*?/([a-z0-9]+)/[^"]*"[^>]*>([^<]+)</a>(?:</span>)?(?:<br\s*/?>)?\s*(.*?)(?=<span class="versiontext">|<p><span class="versiontext">|<div |$)'
-
-    matches = re.finditer(version_pattern, decoded, re.DOTALL | re.IGNORECASE)
+    matches = VERSION_ENTRY_PATTERN.finditer(decoded)
 
     for match in matches:
         url_abbrev = match.group(1).strip()  # e.g., "shu", "niv", "kjv"
@@ -370,12 +426,12 @@ def parse_biblehub_html(html_content: Union[str, bytes]) -> Dict[str, str]:
 
         # Extract text from potential span wrappers
         # Handle language-specific spans like <span class="chi">...</span>, <span class="spa">...</span>, etc.
-        span_match = re.search(r'<span class="[a-z]{2,5}">([^<]+)</span>', raw_text)
+        span_match = LANGUAGE_SPAN_PATTERN.search(raw_text)
         if span_match:
             verse_text = span_match.group(1).strip()
         else:
             # Remove any remaining HTML tags and get text
-            verse_text = re.sub(r'<[^>]+>', '', raw_text).strip()
+            verse_text = HTML_TAG_PATTERN.sub('', raw_text).strip()
 
         # Clean up extra whitespace
         verse_text = ' '.join(verse_text.split())
@@ -421,6 +477,11 @@ def parse_biblehub_file(html_file_path: str) -> Dict[str, str]:
     return parse_biblehub_html(html_bytes)
 
 
+def _truncate(text: str, width: int = 70) -> str:
+    """Shorten text to at most width characters for console display."""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
 def main():
     """Test the BibleHub fetcher with sample verses."""
     print("BibleHub Fetcher Test - FULL VERSION ANALYSIS")
@@ -462,25 +523,19 @@ def main():
             if english_codes:
                 print(f"\n📖 All English translations ({len(english_codes)}):")
                 for key in sorted(english_codes):
-                    text = translations[key]
-                    display_text = text if len(text) <= 70 else text[:67] + "..."
-                    print(f"  {key:20} {display_text}")
+                    print(f"  {key:20} {_truncate(translations[key])}")
             
             # Show all non-English translations
             if other_codes:
                 print(f"\n🌍 All non-English translations ({len(other_codes)}):")
                 for key in sorted(other_codes):
-                    text = translations[key]
-                    display_text = text if len(text) <= 70 else text[:67] + "..."
-                    print(f"  {key:20} {display_text}")
+                    print(f"  {key:20} {_truncate(translations[key])}")
             
             # HIGHLIGHT UNKNOWN CODES
             if unknown_codes:
                 print(f"\n⚠️  UNKNOWN VERSION CODES ({len(unknown_codes)}) - NEED TO ADD TO MAPPINGS:")
                 for key in sorted(unknown_codes):
-                    text = translations[key]
-                    display_text = text if len(text) <= 70 else text[:67] + "..."
-                    print(f"  {key:20} {display_text}")
+                    print(f"  {key:20} {_truncate(translations[key])}")
                     
         except VerseFetchError as e:
             print(f"✗ Error: {e}")
@@ -15,5 +15,16 @@ BIBLEHUB_MULTI_URL_TEMPLATE = "https://biblehub.com/multi/{book}/{chapter}-{vers
 # HTTP request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Retries for transient failures (connection errors, 429, 5xx) with
+# exponential backoff (delay doubles after each failed attempt). Read timeouts
+# are not retried; an unreachable host can take up to
+# (MAX_RETRIES + 1) * REQUEST_TIMEOUT plus backoff before failing.
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Longest wait honoured from a Retry-After header on 429/503, in seconds
+RETRY_AFTER_MAX = 30
+
 # User agent string for HTTP requests
 USER_AGENT = "Mozilla/5.0 (Bible Study Tool)"
@@ -5,6 +5,7 @@ which contains 1,000+ Bible translations in various languages.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -111,6 +112,7 @@ def fetch_verses_from_ebible(book: str, chapter: int, verse: int,
     else:
         return _fetch_and_structure_verse(book, chapter, verse)
 
+@lru_cache(maxsize=None)
 def get_ebible_dir() -> Optional[Path]:
     """
     Get the eBible directory path from environment or default location.
@@ -222,6 +224,32 @@ def normalize_ebible_code(translation_id: str) -> str:
     return f"{lang}-{version}"
 
 
+@lru_cache(maxsize=None)
+def load_vref_index(vref_file: Path) -> Dict[str, int]:
+    """
+    Build a verse reference to line number index from vref.txt.
+
+    Args:
+        vref_file: Path to vref.txt
+
+    Returns:
+        Dictionary mapping "BOOK chapter:verse" to line number (1-based)
+
+    Raises:
+        EbibleFetchError: If vref.txt cannot be read
+    """
+    index = {}
+    try:
+        with open(vref_file, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, start=1):
+                # First occurrence wins
+                index.setdefault(line.strip(), line_num)
+    except IOError as e:
+        raise EbibleFetchError(f"Failed to read vref.txt: {e}")
+
+    return index
+
+
 def get_verse_line_number(book: str, chapter: int, verse: int, vref_file: Path) -> int:
     """
     Get the line number for a verse from vref.txt.
@@ -240,15 +268,11 @@ def get_verse_line_number(book: str, chapter: int, verse: int, vref_file: Path)
     """
     verse_ref = f"{book} {chapter}:{verse}"
 
-    try:
-        with open(vref_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, start=1):
-                if line.strip() == verse_ref:
-                    return line_num
-    except IOError as e:
-        raise EbibleFetchError(f"Failed to read vref.txt: {e}")
+    line_num = load_vref_index(vref_file).get(verse_ref)
+    if line_num is None:
+        raise EbibleFetchError(f"Verse not found in vref.txt: {verse_ref}")
 
-    raise EbibleFetchError(f"Verse not found in vref.txt: {verse_ref}")
+    return line_num
 
 
 def fetch_verse_from_ebible(book: str, chapter: int, verse: int) -> Dict[str, str]:
@@ -319,19 +343,22 @@ def fetch_verse_from_ebible(book: str, chapter: int, verse: int) -> Dict[str, st
 
 def main():
     bible_verses = get_all_verses()
-    print(f"Total verses to fetch: {len(bible_verses)}")
-    for verse in bible_verses:
+    total = len(bible_verses)
+    print(f"Total verses to fetch: {total}")
+    fetched = 0
+    for count, verse in enumerate(bible_verses, start=1):
         book, chapter, verse_num = parse_verse_ref(verse)
         if not (book and chapter and verse_num):
             print(f"Skipping invalid verse entry: {verse}")
-            continue
-        print(f"Fetching {book} {chapter}:{verse_num} from eBible...")
-        try:
-            verse_data = fetch_verses_from_ebible(book, chapter, verse_num)
-            translations_count = len(verse_data.get('translations', {}))
-            print(f"  Found {translations_count} translations.")
-        except EbibleFetchError as e:
-            print(f"  Error fetching {book} {chapter}:{verse_num}: {e}")
+        else:
+            try:
+                fetch_verses_from_ebible(book, chapter, verse_num)
+                fetched += 1
+            except EbibleFetchError as e:
+                print(f"  Error fetching {book} {chapter}:{verse_num}: {e}")
+
+        if count % 100 == 0 or count == total:
+            print(f"  Progress: {count}/{total} verses ({fetched} fetched)")
 
 
 if __name__ == "__main__":
@@ -116,7 +116,33 @@ def get_all_strongs_numbers() -> List[str]:
     return sorted(numbers)
 
 
-def search_strongs_by_word(search_word: str, case_sensitive: bool = False) -> List[str]:
+def load_strongs_entry_cached(
+    strongs_number: str,
+    entry_cache: Optional[Dict[str, Optional[Dict[str, Any]]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a Strong's entry through entry_cache, if one is given.
+
+    Args:
+        strongs_number: Strong's number (e.g., "G0025", "H0430")
+        entry_cache: Dictionary of already loaded entries, updated in place
+
+    Returns:
+        Merged data dictionary or None if not found
+    """
+    if entry_cache is None:
+        return load_strongs_entry(strongs_number)
+
+    if strongs_number not in entry_cache:
+        entry_cache[strongs_number] = load_strongs_entry(strongs_number)
+    return entry_cache[strongs_number]
+
+
+def search_strongs_by_word(
+    search_word: str,
+    case_sensitive: bool = False,
+    entry_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+) -> List[str]:
     """
     Search Strong's dictionary for entries containing an English word.
 
@@ -128,6 +154,7 @@ def search_strongs_by_word(search_word: str, case_sensitive: bool = False) -> Li
     Args:
         search_word: English word to search for
         case_sensitive: Whether to match case
+        entry_cache: Optional dictionary of loaded entries shared across searches
 
     Returns:
         List of matching Strong's numbers
@@ -135,13 +162,16 @@ def search_strongs_by_word(search_word: str, case_sensitive: bool = False) -> Li
     if not case_sensitive:
         search_word = search_word.lower()
 
+    # Match as whole word
+    word_pattern = re.compile(r'\b' + re.escape(search_word) + r'\b')
+
     matching_numbers = []
     all_numbers = get_all_strongs_numbers()
 
     print(f"Searching {len(all_numbers)} Strong's entries for '{search_word}'...", file=sys.stderr)
 
     for strongs_num in all_numbers:
-        entry = load_strongs_entry(strongs_num)
+        entry = load_strongs_entry_cached(strongs_num, entry_cache)
         if not entry:
             continue
 
@@ -159,8 +189,7 @@ def search_strongs_by_word(search_word: str, case_sensitive: bool = False) -> Li
             searchable_text = searchable_text.lower()
 
         # Check if word appears (as whole word)
-        word_pattern = r'\b' + re.escape(search_word) + r'\b'
-        if re.search(word_pattern, searchable_text):
+        if word_pattern.search(searchable_text):
             matching_numbers.append(strongs_num)
 
     print(f"Found {len(matching_numbers)} matches", file=sys.stderr)
@@ -208,17 +237,20 @@ def fetch_strongs_entries(
                     except:
                         pass
 
+    # Entries loaded during this call, shared by the word searches and the final fetch
+    entry_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
     # Add numbers from word searches
     if words:
         for word in words:
-            matching = search_strongs_by_word(word, case_sensitive)
+            matching = search_strongs_by_word(word, case_sensitive, entry_cache)
             all_numbers.update(matching)
 
     # Fetch all entries
     entries = {}
 
     for strongs_num in sorted(all_numbers):
-        entry = load_strongs_entry(strongs_num)
+        entry = load_strongs_entry_cached(strongs_num, entry_cache)
         if entry:
             entries[strongs_num] = entry
 
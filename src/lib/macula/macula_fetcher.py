@@ -22,6 +22,7 @@ import os
 import sys
 import subprocess
 import shutil
+import time
 from pathlib import Path
 from datetime import datetime
 import json
@@ -43,7 +44,7 @@ METADATA_FILE = CACHE_DIR / "metadata.json"
 
 def log(message):
     """Print timestamped log message."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] {message}")
 
 
@@ -13,6 +13,8 @@ Usage:
     python macula_processor.py --book JHN               # Process John
     python macula_processor.py --verse "JHN 1:1"        # Process single verse
     python macula_processor.py --testament NT           # Process NT only
+    python macula_processor.py --all --workers 8        # Process all verses in parallel
+    python macula_processor.py --all --skip-existing    # Resume, skipping verses already written
 """
 
 import os
@@ -25,13 +27,9 @@ import argparse
 import re
 from collections import defaultdict
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s: %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -62,6 +60,19 @@ GREEK_BOOK_MAP = {
     "24-2john": "2JN", "25-3john": "3JN", "26-jude": "JUD", "27-revelation": "REV"
 }
 
+# Reverse lookups (USFM code -> filename prefix)
+HEBREW_FILE_PREFIXES = {code: prefix for prefix, code in HEBREW_BOOK_MAP.items()}
+GREEK_FILE_PREFIXES = {code: prefix for prefix, code in GREEK_BOOK_MAP.items()}
+
+
+def configure_logging():
+    """Configure timestamped INFO logging when run as a script (not on import)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] %(levelname)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
 
 def log(message):
     """Print timestamped log message."""
@@ -265,8 +276,8 @@ def extract_greek_word(word_elem, position):
     return word_data
 
 
-def process_hebrew_verse(chapter_elem, verse_ref):
-    """Process a single Hebrew verse and return structured data."""
+def build_hebrew_verse(sentence, verse_ref):
+    """Build structured Hebrew verse data from its sentence element (None for an empty verse)."""
     book, chapter, verse = parse_verse_ref(verse_ref)
 
     verse_data = {
@@ -278,32 +289,30 @@ def process_hebrew_verse(chapter_elem, verse_ref):
         "words": []
     }
 
-    # Find the sentence for this verse
-    for sentence in chapter_elem.findall(".//sentence[@id]"):
-        if sentence.get("id") == verse_ref:
-            # Extract text
-            p_elem = sentence.find("p")
-            if p_elem is not None:
-                verse_text = "".join(p_elem.itertext()).strip()
-                # Remove the verse reference prefix
-                verse_text = re.sub(r'^[A-Z]+\s+\d+:\d+\s+', '', verse_text)
-                verse_data["text"] = verse_text
-
-            # Extract words
-            position = 1
-            for word in sentence.findall(".//w"):
-                word_data = extract_hebrew_word(word, position)
-                if word_data["text"]:  # Only add if has text
-                    verse_data["words"].append(word_data)
-                    position += 1
-
-            break
+    if sentence is None:
+        return verse_data
+
+    # Extract text
+    p_elem = sentence.find("p")
+    if p_elem is not None:
+        verse_text = "".join(p_elem.itertext()).strip()
+        # Remove the verse reference prefix
+        verse_text = re.sub(r'^[A-Z]+\s+\d+:\d+\s+', '', verse_text)
+        verse_data["text"] = verse_text
+
+    # Extract words
+    position = 1
+    for word in sentence.findall(".//w"):
+        word_data = extract_hebrew_word(word, position)
+        if word_data["text"]:  # Only add if has text
+            verse_data["words"].append(word_data)
+            position += 1
 
     return verse_data
 
 
-def process_greek_verse(book_elem, verse_ref):
-    """Process a single Greek verse and return structured data."""
+def build_greek_verse(sentence, verse_ref):
+    """Build structured Greek verse data from its sentence element (None for an empty verse)."""
     book, chapter, verse = parse_verse_ref(verse_ref)
 
     verse_data = {
@@ -315,54 +324,56 @@ def process_greek_verse(book_elem, verse_ref):
         "words": []
     }
 
-    # Find the sentence for this verse
-    for sentence in book_elem.findall(".//sentence"):
-        milestone = sentence.find(".//milestone[@id]")
-        if milestone is not None and milestone.get("id") == verse_ref:
-            # Extract text
-            p_elem = sentence.find("p")
-            if p_elem is not None:
-                verse_text = "".join(p_elem.itertext()).strip()
-                # Remove the verse reference prefix
-                verse_text = re.sub(r'^[A-Z]+\s+\d+:\d+\s+', '', verse_text)
-                verse_data["text"] = verse_text
-
-            # Extract words
-            position = 1
-            for word in sentence.findall(".//w"):
-                word_data = extract_greek_word(word, position)
-                if word_data["text"]:  # Only add if has text
-                    verse_data["words"].append(word_data)
-                    position += 1
-
-            break
+    if sentence is None:
+        return verse_data
+
+    # Extract text
+    p_elem = sentence.find("p")
+    if p_elem is not None:
+        verse_text = "".join(p_elem.itertext()).strip()
+        # Remove the verse reference prefix
+        verse_text = re.sub(r'^[A-Z]+\s+\d+:\d+\s+', '', verse_text)
+        verse_data["text"] = verse_text
+
+    # Extract words
+    position = 1
+    for word in sentence.findall(".//w"):
+        word_data = extract_greek_word(word, position)
+        if word_data["text"]:  # Only add if has text
+            verse_data["words"].append(word_data)
+            position += 1
 
     return verse_data
 
 
-def save_verse_yaml(verse_data, output_dir):
-    """Save verse data as YAML file."""
-    # Parse verse reference
-    verse_ref = verse_data["verse"]
+def verse_yaml_path(verse_ref, output_dir):
+    """Return the output YAML path for a verse reference like 'JHN 1:1'."""
     book, chapter, verse = parse_verse_ref(verse_ref)
-
-    # Create directory structure
     verse_dir = output_dir / book / f"{chapter:03d}" / f"{verse:03d}"
-    verse_dir.mkdir(parents=True, exist_ok=True)
+    return verse_dir / f"{book}-{chapter:03d}-{verse:03d}-macula.yaml"
+
 
-    # Generate filename
-    filename = f"{book}-{chapter:03d}-{verse:03d}-macula.yaml"
-    filepath = verse_dir / filename
+def save_verse_yaml(verse_data, output_dir):
+    """Save verse data as YAML file."""
+    filepath = verse_yaml_path(verse_data["verse"], output_dir)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save YAML
-    with open(filepath, 'w', encoding='utf-8') as f:
-        yaml.dump(verse_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Write to a temp file and rename it into place, so an interrupted run never
+    # leaves a truncated YAML that --skip-existing would treat as done
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yaml.dump(verse_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     return filepath
 
 
-def process_hebrew_file(xml_file, output_dir):
-    """Process a single Hebrew XML file."""
+def process_hebrew_file(xml_file, output_dir, skip_existing=False):
+    """Process a single Hebrew XML file, optionally skipping verses already written."""
     log(f"Processing {xml_file.name}...")
 
     try:
@@ -370,15 +381,22 @@ def process_hebrew_file(xml_file, output_dir):
         root = tree.getroot()
 
         verse_count = 0
+        skipped = 0
+        seen = set()
         for sentence in root.findall(".//sentence[@id]"):
             verse_ref = sentence.get("id")
-            if verse_ref:
-                verse_data = process_hebrew_verse(root, verse_ref)
+            # A verse is built from the first sentence carrying its id
+            if verse_ref and verse_ref not in seen:
+                seen.add(verse_ref)
+                if skip_existing and verse_yaml_path(verse_ref, output_dir).exists():
+                    skipped += 1
+                    continue
+                verse_data = build_hebrew_verse(sentence, verse_ref)
                 if verse_data["words"]:  # Only save if has words
                     save_verse_yaml(verse_data, output_dir)
                     verse_count += 1
 
-        log(f"  ✓ Processed {verse_count} verses")
+        log(f"  ✓ Processed {verse_count} verses" + (f" (skipped {skipped} existing)" if skipped else ""))
         return verse_count
 
     except Exception as e:
@@ -386,24 +404,34 @@ def process_hebrew_file(xml_file, output_dir):
         return 0
 
 
-def process_greek_file(xml_file, output_dir):
-    """Process a single Greek XML file."""
+def process_greek_file(xml_file, output_dir, skip_existing=False):
+    """Process a single Greek XML file, optionally skipping verses already written."""
     log(f"Processing {xml_file.name}...")
 
     try:
         tree = ET.parse(xml_file)
         root = tree.getroot()
 
-        verse_count = 0
-        for milestone in root.findall(".//milestone[@id]"):
-            verse_ref = milestone.get("id")
-            if verse_ref:
-                verse_data = process_greek_verse(root, verse_ref)
-                if verse_data["words"]:  # Only save if has words
-                    save_verse_yaml(verse_data, output_dir)
-                    verse_count += 1
+        # A Greek verse is the first sentence whose first milestone is the verse;
+        # milestones that only occur mid-sentence have no words of their own
+        verse_sentences = {}
+        for sentence in root.findall(".//sentence"):
+            milestone = sentence.find(".//milestone[@id]")
+            if milestone is not None and milestone.get("id"):
+                verse_sentences.setdefault(milestone.get("id"), sentence)
 
-        log(f"  ✓ Processed {verse_count} verses")
+        verse_count = 0
+        skipped = 0
+        for verse_ref, sentence in verse_sentences.items():
+            if skip_existing and verse_yaml_path(verse_ref, output_dir).exists():
+                skipped += 1
+                continue
+            verse_data = build_greek_verse(sentence, verse_ref)
+            if verse_data["words"]:  # Only save if has words
+                save_verse_yaml(verse_data, output_dir)
+                verse_count += 1
+
+        log(f"  ✓ Processed {verse_count} verses" + (f" (skipped {skipped} existing)" if skipped else ""))
         return verse_count
 
     except Exception as e:
@@ -411,6 +439,71 @@ def process_greek_file(xml_file, output_dir):
         return 0
 
 
+def process_files(xml_files, process_file, output_dir, workers=1, skip_existing=False):
+    """
+    Run process_file over xml_files and return the total verse count.
+
+    Each file writes a disjoint set of verses, so with workers > 1 the files are
+    parsed in parallel worker processes (XML parsing is CPU-bound).
+    """
+    if workers <= 1:
+        return sum(process_file(xml_file, output_dir, skip_existing) for xml_file in xml_files)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=configure_logging) as executor:
+        return sum(executor.map(process_file, xml_files, repeat(output_dir), repeat(skip_existing)))
+
+
+def process_verse(verse_ref, output_dir, dry_run=False):
+    """
+    Process a single verse (e.g. 'JHN 1:1') and save its YAML file.
+
+    Returns 1 if the verse was found and saved, 0 otherwise.
+    """
+    book, chapter, verse = parse_verse_ref(verse_ref)
+    if not book:
+        log(f"ERROR: Invalid verse reference '{verse_ref}'. Use format: 'JHN 1:1'")
+        return 0
+
+    # Determine if OT or NT
+    if book in HEBREW_FILE_PREFIXES:
+        log(f"Processing Hebrew verse: {verse_ref}")
+        if HEBREW_LOWFAT.exists():
+            for xml_file in sorted(HEBREW_LOWFAT.glob(f"{HEBREW_FILE_PREFIXES[book]}-*.xml")):
+                try:
+                    root = ET.parse(xml_file).getroot()
+                    for sentence in root.findall(".//sentence[@id]"):
+                        if sentence.get("id") == verse_ref:
+                            verse_data = build_hebrew_verse(sentence, verse_ref)
+                            if verse_data["words"] and not dry_run:
+                                save_verse_yaml(verse_data, output_dir)
+                                log(f"✓ Processed {verse_ref}")
+                                return 1
+                            break
+                except Exception:
+                    continue
+    else:
+        log(f"Processing Greek verse: {verse_ref}")
+        # Find the Greek file
+        if GREEK_LOWFAT.exists() and book in GREEK_FILE_PREFIXES:
+            for xml_file in sorted(GREEK_LOWFAT.glob(f"{GREEK_FILE_PREFIXES[book]}.xml")):
+                try:
+                    root = ET.parse(xml_file).getroot()
+                    # A Greek verse is the sentence whose first milestone is the verse
+                    for sentence in root.findall(".//sentence"):
+                        milestone = sentence.find(".//milestone[@id]")
+                        if milestone is not None and milestone.get("id") == verse_ref:
+                            verse_data = build_greek_verse(sentence, verse_ref)
+                            if verse_data["words"] and not dry_run:
+                                save_verse_yaml(verse_data, output_dir)
+                                log(f"✓ Processed {verse_ref}")
+                                return 1
+                            break
+                except Exception:
+                    continue
+
+    return 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -423,8 +516,15 @@ def main():
     parser.add_argument("--verse", help="Process single verse (e.g., 'JHN 1:1')")
     parser.add_argument("--output", default=OUTPUT_DIR, help="Output directory")
     parser.add_argument("--dry-run", action="store_true", help="Test without writing files")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes for multi-file runs (default: 1)")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="Skip verses whose YAML file already exists (resume an interrupted run)")
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    configure_logging()
 
     # Handle --nt shortcut
     if args.nt:
@@ -449,54 +549,7 @@ def main():
             log(f"ERROR: Invalid verse reference '{args.verse}'. Use format: 'JHN 1:1'")
             sys.exit(1)
 
-        # Determine if OT or NT
-        is_ot = book in ["GEN", "EXO", "LEV", "NUM", "DEU", "JOS", "JDG", "RUT",
-                         "1SA", "2SA", "1KI", "2KI", "1CH", "2CH", "EZR", "NEH",
-                         "EST", "JOB", "PSA", "PRO", "ECC", "SNG", "ISA", "JER",
-                         "LAM", "EZK", "DAN", "HOS", "JOL", "AMO", "OBA", "JON",
-                         "MIC", "NAM", "HAB", "ZEP", "HAG", "ZEC", "MAL"]
-
-        if is_ot:
-            log(f"Processing Hebrew verse: {args.verse}")
-            # Find the Hebrew file (need to map book code back to filename)
-            # For now, process all Hebrew files and filter
-            if HEBREW_LOWFAT.exists():
-                for xml_file in sorted(HEBREW_LOWFAT.glob("*.xml")):
-                    try:
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        for sentence in root.findall(".//sentence[@id]"):
-                            if sentence.get("id") == args.verse:
-                                verse_data = process_hebrew_verse(root, args.verse)
-                                if verse_data["words"] and not args.dry_run:
-                                    save_verse_yaml(verse_data, output_dir)
-                                    total_verses = 1
-                                    log(f"✓ Processed {args.verse}")
-                                break
-                        if total_verses > 0:
-                            break
-                    except Exception as e:
-                        continue
-        else:
-            log(f"Processing Greek verse: {args.verse}")
-            # Find the Greek file
-            if GREEK_LOWFAT.exists():
-                for xml_file in sorted(GREEK_LOWFAT.glob("*.xml")):
-                    try:
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        for milestone in root.findall(".//milestone[@id]"):
-                            if milestone.get("id") == args.verse:
-                                verse_data = process_greek_verse(root, args.verse)
-                                if verse_data["words"] and not args.dry_run:
-                                    save_verse_yaml(verse_data, output_dir)
-                                    total_verses = 1
-                                    log(f"✓ Processed {args.verse}")
-                                break
-                        if total_verses > 0:
-                            break
-                    except Exception as e:
-                        continue
+        total_verses = process_verse(args.verse, output_dir, dry_run=args.dry_run)
 
         if total_verses == 0:
             log(f"WARNING: Verse '{args.verse}' not found in dataset")
@@ -515,15 +568,10 @@ def main():
         if is_ot:
             log(f"Processing Hebrew book: {book_code}")
             if HEBREW_LOWFAT.exists():
-                # Find matching Hebrew files
-                for xml_file in sorted(HEBREW_LOWFAT.glob("*.xml")):
-                    # Check if this file is for the requested book
-                    tree = ET.parse(xml_file)
-                    root = tree.getroot()
-                    chapter_id = root.get("id", "")
-                    if chapter_id.startswith(book_code):
-                        if not args.dry_run:
-                            total_verses += process_hebrew_file(xml_file, output_dir)
+                # Chapter files are named by book prefix (e.g. 01-Gen-001-lowfat.xml)
+                xml_files = sorted(HEBREW_LOWFAT.glob(f"{HEBREW_FILE_PREFIXES[book_code]}-*.xml"))
+                if not args.dry_run:
+                    total_verses += process_files(xml_files, process_hebrew_file, output_dir, args.workers, args.skip_existing)
         else:
             log(f"Processing Greek book: {book_code}")
             if GREEK_LOWFAT.exists():
@@ -547,7 +595,7 @@ def main():
                 if book_code in book_file_map:
                     xml_file = GREEK_LOWFAT / book_file_map[book_code]
                     if xml_file.exists() and not args.dry_run:
-                        total_verses += process_greek_file(xml_file, output_dir)
+                        total_verses += process_greek_file(xml_file, output_dir, args.skip_existing)
                 else:
                     log(f"ERROR: Unknown book code '{book_code}'")
 
@@ -555,18 +603,18 @@ def main():
     elif args.testament == "OT" or args.all:
         log("Processing Hebrew (OT)...")
         if HEBREW_LOWFAT.exists():
-            for xml_file in sorted(HEBREW_LOWFAT.glob("*.xml")):
-                if not args.dry_run:
-                    total_verses += process_hebrew_file(xml_file, output_dir)
+            if not args.dry_run:
+                xml_files = sorted(HEBREW_LOWFAT.glob("*.xml"))
+                total_verses += process_files(xml_files, process_hebrew_file, output_dir, args.workers, args.skip_existing)
         else:
             log("Hebrew directory not found")
 
     if (args.testament == "NT" or args.all) and not args.verse:
         log("Processing Greek (NT)...")
         if GREEK_LOWFAT.exists():
-            for xml_file in sorted(GREEK_LOWFAT.glob("*.xml")):
-                if not args.dry_run:
-                    total_verses += process_greek_file(xml_file, output_dir)
+            if not args.dry_run:
+                xml_files = sorted(GREEK_LOWFAT.glob("*.xml"))
+                total_verses += process_files(xml_files, process_greek_file, output_dir, args.workers, args.skip_existing)
         else:
             log("Greek directory not found")
 
@@ -7,11 +7,12 @@ into a unified output. Supports depth levels, filtering, and verse ranges.
 """
 
 import argparse
+import json
 import re
 import sys
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -147,13 +148,15 @@ def get_commentary_files(
     if not verse_dir.exists():
         return files
 
+    verse_pattern = re.compile(rf'{book}_{chapter}_{verse_padded}\.(.+)\.yaml')
+
     # Get all YAML files in verse directory
     # Format: BOOK_chapter_verse.suffix.yaml (underscores, not periods)
     for file_path in verse_dir.glob(f"{book}_{chapter}_{verse_padded}.*.yaml"):
         # Extract tool suffix from filename
         # Format: BOOK_chapter_verse.suffix.yaml
         filename = file_path.name
-        match = re.match(rf'{book}_{chapter}_{verse_padded}\.(.+)\.yaml', filename)
+        match = verse_pattern.match(filename)
         if not match:
             continue
 
@@ -185,9 +188,10 @@ def get_commentary_files(
     # For full depth, add chapter-level and book-level files
     if depth == 'full':
         # Chapter-level files (format: BOOK_chapter.suffix.yaml)
+        chapter_pattern = re.compile(rf'{book}_{chapter}\.(.+)\.yaml')
         for file_path in verse_dir.glob(f"{book}_{chapter}.*.yaml"):
             # Extract suffix
-            match = re.match(rf'{book}_{chapter}\.(.+)\.yaml', file_path.name)
+            match = chapter_pattern.match(file_path.name)
             if not match:
                 continue
             tool_suffix = match.group(1)
@@ -200,9 +204,10 @@ def get_commentary_files(
         # Book-level files (format: BOOK.suffix.yaml)
         book_dir = base_path / book
         if book_dir.exists():
+            book_pattern = re.compile(rf'{book}\.(.+)\.yaml')
             for file_path in book_dir.glob(f"{book}.*.yaml"):
                 # Extract suffix
-                match = re.match(rf'{book}\.(.+)\.yaml', file_path.name)
+                match = book_pattern.match(file_path.name)
                 if not match:
                     continue
                 tool_suffix = match.group(1)
@@ -312,10 +317,11 @@ def list_available_tools(
             continue
 
         tools = []
+        verse_pattern = re.compile(rf'{book}_{chapter}_{verse_padded}\.(.+)\.yaml')
         # Filename format: BOOK_chapter_verse.suffix.yaml
         for file_path in verse_dir.glob(f"{book}_{chapter}_{verse_padded}.*.yaml"):
             filename = file_path.name
-            match = re.match(rf'{book}_{chapter}_{verse_padded}\.(.+)\.yaml', filename)
+            match = verse_pattern.match(filename)
             if match:
                 tools.append(match.group(1))
 
@@ -324,6 +330,47 @@ def list_available_tools(
     return result
 
 
+def dump_output(
+    data: Any,
+    output: Optional[Path],
+    as_json: bool,
+    ensure_ascii: bool = True,
+    sort_keys: bool = True
+) -> None:
+    """
+    Serialize data as JSON or YAML to stdout, or stream it into an output file.
+
+    File output is written to a temporary file next to the target and renamed
+    into place, so a serialization error never leaves a half-written file.
+
+    Args:
+        data: Data to serialize
+        output: Output file path, or None for stdout
+        as_json: Output JSON instead of YAML
+        ensure_ascii: Escape non-ASCII characters in JSON output
+        sort_keys: Sort mapping keys in YAML output
+    """
+    if output is None:
+        if as_json:
+            print(json.dumps(data, indent=2, ensure_ascii=ensure_ascii))
+        else:
+            print(yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=sort_keys))
+        return
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f".{output.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if as_json:
+                json.dump(data, f, indent=2, ensure_ascii=ensure_ascii)
+            else:
+                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=sort_keys)
+        tmp_path.replace(output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Aggregate and merge Bible commentary data for verse study'
@@ -384,17 +431,8 @@ def main():
     # List tools mode
     if args.list_tools:
         tools = list_available_tools(verses, commentary_base)
-        if args.json:
-            import json
-            output = json.dumps(tools, indent=2)
-        else:
-            output = yaml.dump(tools, default_flow_style=False, allow_unicode=True)
 
-        if args.output:
-            args.output.parent.mkdir(parents=True, exist_ok=True)
-            args.output.write_text(output, encoding='utf-8')
-        else:
-            print(output)
+        dump_output(tools, args.output, args.json)
         return
 
     # Load tool registry
@@ -411,18 +449,9 @@ def main():
     )
 
     # Output
-    if args.json:
-        import json
-        output = json.dumps(result, indent=2, ensure_ascii=False)
-    else:
-        output = yaml.dump(result, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
+    dump_output(result, args.output, args.json, ensure_ascii=False, sort_keys=False)
     if args.output:
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(output, encoding='utf-8')
         print(f"Output saved to: {args.output}")
-    else:
-        print(output)
 
 
 if __name__ == '__main__':
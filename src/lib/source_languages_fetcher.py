@@ -72,11 +72,10 @@ def load_macula_data(book: str, chapter: int, verse: int) -> Optional[Dict[str,
 
 def generate_macula_data(verse_ref: str) -> Optional[Dict[str, Any]]:
     """
-    Generate Macula data for a verse by calling macula_processor.
+    Generate Macula data for a verse by running macula_processor in-process.
     Returns the loaded data or None if generation failed.
     """
-    from lib.macula.macula_processor import main as process_macula
-    import subprocess
+    from lib.macula.macula_processor import process_verse
 
     book, chapter, verse = parse_verse_ref(verse_ref)
     if not book:
@@ -84,18 +83,10 @@ def generate_macula_data(verse_ref: str) -> Optional[Dict[str, Any]]:
 
     print(f"Generating Macula data for {verse_ref}...", file=sys.stderr)
 
-    # Call macula_processor script
-    processor_path = PROJECT_ROOT / "src" / "lib" / "macula" / "macula_processor.py"
     try:
-        result = subprocess.run(
-            [sys.executable, str(processor_path), "--verse", verse_ref],
-            capture_output=True,
-            text=True,
-            cwd=PROJECT_ROOT
-        )
-
-        if result.returncode != 0:
-            print(f"Failed to generate Macula data: {result.stderr}", file=sys.stderr)
+        # Write where load_macula_data reads from
+        if not process_verse(verse_ref, MACULA_CACHE):
+            print(f"Failed to generate Macula data for {verse_ref}", file=sys.stderr)
             return None
 
         # Load the generated data
@@ -106,58 +97,53 @@ def generate_macula_data(verse_ref: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def extract_strongs_numbers(macula_data: Dict[str, Any]) -> List[str]:
+def get_word_strongs_numbers(word: Dict[str, Any], prefix: str) -> List[str]:
     """
-    Extract all Strong's numbers from Macula word data.
-    Returns a list of unique Strong's numbers (e.g., ['G0001', 'G0002']).
+    Extract the Strong's numbers for a single Macula word.
+    Plain numbers are given the language prefix and padded to 4 digits (e.g. '1063' -> 'G1063').
     """
-    strongs_numbers = []
+    numbers = []
+
+    # Hebrew words have 'lexical.strong' or 'lexical.stronglemma'
+    # Greek words have 'lexical.strong'
+    lexical = word.get("lexical")
+    if not lexical:
+        return numbers
+
+    # Handle multiple Strong's numbers (space-separated)
+    for field in [lexical.get("strong", ""), lexical.get("stronglemma", "")]:
+        if field:
+            # Convert to string if needed
+            field_str = str(field)
+
+            # Split on whitespace and extract numbers
+            for num in field_str.split():
+                # Check if already has prefix (e.g., "H0430a" or "G1063")
+                with_prefix = re.match(r'([HG]\d+)', num)
+                if with_prefix:
+                    numbers.append(with_prefix.group(1))
+                else:
+                    # Plain number (e.g., "1063") - add prefix and pad to 4 digits
+                    plain_num = re.match(r'(\d+)', num)
+                    if plain_num and prefix:
+                        padded = plain_num.group(1).zfill(4)
+                        numbers.append(f"{prefix}{padded}")
+
+    return numbers
+
+
+def get_language_prefix(macula_data: Dict[str, Any]) -> str:
+    """Return the Strong's prefix for the Macula data language (G for Greek, H for Hebrew)."""
+    language = macula_data.get("language", "")
+    return "G" if language == "grc" else "H" if language == "heb" else ""
 
-    if "words" not in macula_data:
-        return strongs_numbers
 
-    # Determine language prefix (G for Greek, H for Hebrew)
-    language = macula_data.get("language", "")
-    prefix = "G" if language == "grc" else "H" if language == "heb" else ""
-
-    for word in macula_data["words"]:
-        # Hebrew words have 'lexical.strong' or 'lexical.stronglemma'
-        # Greek words have 'lexical.strong'
-        if "lexical" in word:
-            lexical = word["lexical"]
-
-            # Get Strong's number(s)
-            strong = lexical.get("strong", "")
-            stronglemma = lexical.get("stronglemma", "")
-
-            # Handle multiple Strong's numbers (space-separated)
-            for field in [strong, stronglemma]:
-                if field:
-                    # Convert to string if needed
-                    field_str = str(field)
-
-                    # Split on whitespace and extract numbers
-                    for num in field_str.split():
-                        # Check if already has prefix (e.g., "H0430a" or "G1063")
-                        with_prefix = re.match(r'([HG]\d+)', num)
-                        if with_prefix:
-                            strongs_numbers.append(with_prefix.group(1))
-                        else:
-                            # Plain number (e.g., "1063") - add prefix and pad to 4 digits
-                            plain_num = re.match(r'(\d+)', num)
-                            if plain_num and prefix:
-                                padded = plain_num.group(1).zfill(4)
-                                strongs_numbers.append(f"{prefix}{padded}")
-
-    # Return unique numbers, preserving order
-    seen = set()
-    unique_numbers = []
-    for num in strongs_numbers:
-        if num not in seen:
-            seen.add(num)
-            unique_numbers.append(num)
-
-    return unique_numbers
+def extract_strongs_numbers(word_strongs: List[List[str]]) -> List[str]:
+    """
+    Collect the unique Strong's numbers from per-word lists (see get_word_strongs_numbers).
+    Returns a list of unique Strong's numbers in first-seen order (e.g., ['G0001', 'G0002']).
+    """
+    return list(dict.fromkeys(num for nums in word_strongs for num in nums))
 
 
 def load_strongs_entry(strongs_number: str) -> Optional[Dict[str, Any]]:
@@ -215,8 +201,10 @@ def fetch_source_languages(verse_ref: str, generate_if_missing: bool = True) ->
             "Run macula_processor.py first or ensure Macula datasets are downloaded."
         )
 
-    # Extract Strong's numbers
-    strongs_numbers = extract_strongs_numbers(macula_data)
+    words = macula_data.get("words", [])
+    prefix = get_language_prefix(macula_data)
+    word_strongs = [get_word_strongs_numbers(word, prefix) for word in words]
+    strongs_numbers = extract_strongs_numbers(word_strongs)
 
     if not strongs_numbers:
         print(f"Warning: No Strong's numbers found in {verse_ref}", file=sys.stderr)
@@ -230,42 +218,18 @@ def fetch_source_languages(verse_ref: str, generate_if_missing: bool = True) ->
 
     # Build enhanced word list with Strong's data
     enhanced_words = []
-    language = macula_data.get("language", "")
-    prefix = "G" if language == "grc" else "H" if language == "heb" else ""
-
-    if "words" in macula_data:
-        for word in macula_data["words"]:
-            enhanced_word = word.copy()
-
-            # Add Strong's entry data
-            if "lexical" in word:
-                lexical = word["lexical"]
-                strong_nums = []
-
-                # Extract Strong's number(s)
-                for field in [lexical.get("strong", ""), lexical.get("stronglemma", "")]:
-                    if field:
-                        field_str = str(field)
-                        for num in field_str.split():
-                            # Check if already has prefix
-                            with_prefix = re.match(r'([HG]\d+)', num)
-                            if with_prefix:
-                                strong_nums.append(with_prefix.group(1))
-                            else:
-                                # Plain number - add prefix and pad
-                                plain_num = re.match(r'(\d+)', num)
-                                if plain_num and prefix:
-                                    padded = plain_num.group(1).zfill(4)
-                                    strong_nums.append(f"{prefix}{padded}")
-
-                # Attach Strong's entries
-                if strong_nums:
-                    enhanced_word["strongs_data"] = {}
-                    for num in strong_nums:
-                        if num in strongs_entries:
-                            enhanced_word["strongs_data"][num] = strongs_entries[num]
-
-            enhanced_words.append(enhanced_word)
+
+    for word, strong_nums in zip(words, word_strongs):
+        enhanced_word = word.copy()
+
+        # Attach Strong's entries
+        if strong_nums:
+            enhanced_word["strongs_data"] = {}
+            for num in strong_nums:
+                if num in strongs_entries:
+                    enhanced_word["strongs_data"][num] = strongs_entries[num]
+
+        enhanced_words.append(enhanced_word)
 
     # Build result
     result = {
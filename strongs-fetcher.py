@@ -28,6 +28,7 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 
 # Configuration
@@ -52,6 +53,9 @@ PROXIMITY_GREEK = "https://raw.githubusercontent.com/Clear-Bible/macula-greek/ma
 # Hebrew Lexicon cross-reference data (BDB, TWOT)
 HEBREW_LEXICON_URL = "https://raw.githubusercontent.com/openscriptures/HebrewLexicon/master/LexicalIndex.xml"
 
+# <BR>, <br/>, <Br /> etc.
+BR_TAG_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
+
 
 def download_file(url: str) -> str:
     """Download a file from URL and return its contents as string."""
@@ -70,23 +74,41 @@ def download_to_cache(url: str, cache_file: Path) -> Path:
     cache_file.parent.mkdir(parents=True, exist_ok=True)
 
     content = download_file(url)
-    with open(cache_file, 'w', encoding='utf-8') as f:
+
+    # Rename into place so an interrupted write never leaves a partial cache file
+    tmp_file = cache_file.with_name(f".{cache_file.name}.tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         f.write(content)
+    os.replace(tmp_file, cache_file)
 
     return cache_file
 
 
+def download_all_to_cache(downloads: Dict[str, Tuple[str, Path]]) -> Dict[str, Path]:
+    """
+    Download several files to cache concurrently.
+
+    Returns: {name: cached_path}
+    """
+    with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+        futures = {
+            name: executor.submit(download_to_cache, url, cache_file)
+            for name, (url, cache_file) in downloads.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
 def download_stepbible_lexicons() -> Dict[str, Path]:
     """Download STEPBible lexicons to cache."""
     print("\n📥 Downloading STEPBible lexicons...")
 
     stepbible_dir = CACHE_DIR / "stepbible"
 
-    files = {
-        'greek_brief': download_to_cache(STEPBIBLE_TBESG, stepbible_dir / "TBESG.tsv"),
-        'hebrew_brief': download_to_cache(STEPBIBLE_TBESH, stepbible_dir / "TBESH.tsv"),
-        'greek_full': download_to_cache(STEPBIBLE_TFLSJ, stepbible_dir / "TFLSJ.tsv"),
-    }
+    files = download_all_to_cache({
+        'greek_brief': (STEPBIBLE_TBESG, stepbible_dir / "TBESG.tsv"),
+        'hebrew_brief': (STEPBIBLE_TBESH, stepbible_dir / "TBESH.tsv"),
+        'greek_full': (STEPBIBLE_TFLSJ, stepbible_dir / "TFLSJ.tsv"),
+    })
 
     print("  ✓ STEPBible lexicons ready\n")
     return files
@@ -98,10 +120,10 @@ def download_proximity_data() -> Dict[str, Path]:
 
     proximity_dir = CACHE_DIR / "proximity"
 
-    files = {
-        'hebrew': download_to_cache(PROXIMITY_HEBREW, proximity_dir / "hebrew_proximity.tsv"),
-        'greek': download_to_cache(PROXIMITY_GREEK, proximity_dir / "greek_proximity.tsv"),
-    }
+    files = download_all_to_cache({
+        'hebrew': (PROXIMITY_HEBREW, proximity_dir / "hebrew_proximity.tsv"),
+        'greek': (PROXIMITY_GREEK, proximity_dir / "greek_proximity.tsv"),
+    })
 
     print("  ✓ Proximity data ready\n")
     return files
@@ -122,31 +144,21 @@ def parse_stepbible_tsv(filepath: Path) -> Dict[str, Dict[str, str]]:
     with open(filepath, 'r', encoding='utf-8-sig') as f:  # utf-8-sig to handle BOM
         # Skip header lines until we find the column headers
         # Look for a line that has multiple tab-separated fields including 'eStrong' or 'Strong'
-        lines = f.readlines()
-
-        # Find the header line
-        header_line_idx = None
-        for i, line in enumerate(lines):
+        headers = None
+        for line in f:
             fields = line.strip().split('\t')
             # Header line should have multiple fields and contain 'eStrong' or 'Strong'
             if len(fields) >= 5 and any('Strong' in field for field in fields):
-                header_line_idx = i
+                # Parse column names from header line
+                headers = [h.strip() for h in line.split('\t')]
                 break
 
-        if header_line_idx is None:
+        if headers is None:
             print(f"  Warning: Could not find header line in {filepath.name}")
             return result
 
-        # Parse column names from header line
-        headers = [h.strip() for h in lines[header_line_idx].split('\t')]
-
-        # Find the first data line (skip separator lines like ===)
-        data_start_idx = header_line_idx + 1
-        while data_start_idx < len(lines) and lines[data_start_idx].startswith('='):
-            data_start_idx += 1
-
-        # Process data rows
-        for line in lines[data_start_idx:]:
+        # Process data rows (skip separator lines like ===)
+        for line in f:
             line = line.strip()
             if not line or line.startswith('='):
                 continue
@@ -268,9 +280,8 @@ def strip_html(html_text: str) -> str:
     if not html_text:
         return ""
 
-    # Replace BR tags with newlines first
-    html_text = re.sub(r'<BR\s*/?>', '\n', html_text, flags=re.IGNORECASE)
-    html_text = re.sub(r'<br\s*/?>', '\n', html_text, flags=re.IGNORECASE)
+    # Replace BR tags (any case) with newlines first
+    html_text = BR_TAG_PATTERN.sub('\n', html_text)
 
     # Use BeautifulSoup to strip HTML
     soup = BeautifulSoup(html_text, 'lxml')
@@ -560,33 +571,36 @@ def create_strongs_file(strongs_num: str, entry: Dict[str, Any], enhancement_dat
     return yaml_path
 
 
-def process_dictionary(url: str, dict_name: str, enhancement_data: Dict[str, Any] = None, all_dictionaries: Dict[str, Dict] = None):
-    """Download and process a Strong's dictionary (Greek or Hebrew) with enhancements."""
+def build_strongs_lookup(all_dictionaries: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Build a complete Strong's lookup (formatted numbers -> entries) across dictionaries."""
+    all_strongs = {}
+    for d in all_dictionaries.values():
+        for num, entry in d.items():
+            all_strongs[format_strongs_number(num)] = entry
+    return all_strongs
+
+
+def process_dictionary(dictionary: Dict[str, Any], dict_name: str, enhancement_data: Dict[str, Any] = None, all_strongs: Dict[str, Dict] = None):
+    """
+    Process an already-parsed Strong's dictionary (Greek or Hebrew) with enhancements.
+    """
     print(f"\n{'='*60}")
     print(f"Processing {dict_name} dictionary...")
     print(f"{'='*60}\n")
 
-    # Download the JS file
-    js_content = download_file(url)
-
-    # Parse the JavaScript dictionary
-    print(f"Parsing {dict_name} dictionary...")
-    dictionary = parse_javascript_dict(js_content)
-
     print(f"Found {len(dictionary)} entries in {dict_name} dictionary")
 
-    # Build a complete strongs lookup (formatted numbers -> entries)
-    all_strongs = {}
-    if all_dictionaries:
-        for d in all_dictionaries.values():
-            for num, entry in d.items():
-                formatted = format_strongs_number(num)
-                all_strongs[formatted] = entry
-
     # Process each entry
     created_count = 0
     enhanced_count = 0
 
+    # Enhancement tables by Strong's prefix: (brief lexicon, proximity synonyms)
+    if enhancement_data:
+        enhancement_lookups = {
+            'G': (enhancement_data.get('greek_brief', {}), enhancement_data.get('proximity_greek', {})),
+            'H': (enhancement_data.get('hebrew_brief', {}), enhancement_data.get('proximity_hebrew', {})),
+        }
+
     for strongs_num, entry in dictionary.items():
         try:
             # Format the number for lookup in enhancement data
@@ -598,11 +612,9 @@ def process_dictionary(url: str, dict_name: str, enhancement_data: Dict[str, Any
 
             # Count how many were enhanced
             if enhancement_data:
-                lang_key = 'greek_brief' if formatted_num.startswith('G') else 'hebrew_brief'
-                prox_key = 'proximity_greek' if formatted_num.startswith('G') else 'proximity_hebrew'
+                brief, proximity = enhancement_lookups['G' if formatted_num.startswith('G') else 'H']
 
-                if formatted_num in enhancement_data.get(lang_key, {}) or \
-                   formatted_num in enhancement_data.get(prox_key, {}):
+                if formatted_num in brief or formatted_num in proximity:
                     enhanced_count += 1
 
             if created_count % 100 == 0:
@@ -648,41 +660,55 @@ def main():
     print("Downloading base Strong's dictionaries...")
     print("="*60 + "\n")
 
+    base_dir = CACHE_DIR / "openscriptures"
+
+    greek_file = base_dir / "strongs-greek-dictionary.js"
     try:
-        greek_content = download_file(GREEK_URL)
+        greek_content = download_to_cache(GREEK_URL, greek_file).read_text(encoding='utf-8')
         greek_dict = parse_javascript_dict(greek_content)
         print(f"✓ Loaded {len(greek_dict)} Greek entries")
     except Exception as e:
         print(f"✗ Error loading Greek dictionary: {e}")
+        # Drop a bad cached copy so the next run downloads it again
+        greek_file.unlink(missing_ok=True)
         greek_dict = {}
 
+    hebrew_file = base_dir / "strongs-hebrew-dictionary.js"
     try:
-        hebrew_content = download_file(HEBREW_URL)
+        hebrew_content = download_to_cache(HEBREW_URL, hebrew_file).read_text(encoding='utf-8')
         hebrew_dict = parse_javascript_dict(hebrew_content)
         print(f"✓ Loaded {len(hebrew_dict)} Hebrew entries\n")
     except Exception as e:
         print(f"✗ Error loading Hebrew dictionary: {e}")
+        # Drop a bad cached copy so the next run downloads it again
+        hebrew_file.unlink(missing_ok=True)
         hebrew_dict = {}
 
     all_dictionaries = {
         'greek': greek_dict,
         'hebrew': hebrew_dict
     }
+    all_strongs = build_strongs_lookup(all_dictionaries)
 
-    # Process Greek dictionary
-    try:
-        process_dictionary(GREEK_URL, "Greek", enhancement_data, all_dictionaries)
-    except Exception as e:
-        print(f"\n✗ Error processing Greek dictionary: {e}")
+    # Process each dictionary (skipping any that failed to load above)
+    failed = []
+    for dictionary, dict_name in ((greek_dict, "Greek"), (hebrew_dict, "Hebrew")):
+        if not dictionary:
+            print(f"\n✗ Error processing {dict_name} dictionary: no entries loaded")
+            failed.append(dict_name)
+            continue
 
-    # Process Hebrew dictionary
-    try:
-        process_dictionary(HEBREW_URL, "Hebrew", enhancement_data, all_dictionaries)
-    except Exception as e:
-        print(f"\n✗ Error processing Hebrew dictionary: {e}")
+        try:
+            process_dictionary(dictionary, dict_name, enhancement_data, all_strongs)
+        except Exception as e:
+            print(f"\n✗ Error processing {dict_name} dictionary: {e}")
+            failed.append(dict_name)
 
     print("\n" + "="*60)
-    print("✓ Strong's Dictionary Fetcher completed!")
+    if failed:
+        print(f"✗ Strong's Dictionary Fetcher completed with errors ({', '.join(failed)})")
+    else:
+        print("✓ Strong's Dictionary Fetcher completed!")
     print("="*60)
 
 